@@ -0,0 +1,23 @@
+from src.database.PostgresConnection import PostgresConnection
+from src.database.ParquetExporter import ParquetExporter
+from sqlalchemy.engine import Engine
+from typing import Dict
+import argparse
+
+if __name__ == "__main__":
+    arg_parser: argparse.ArgumentParser = argparse.ArgumentParser(description='Export the GoodReads database to Parquet.')
+    arg_parser.add_argument('--output-dir', default='./parquet', help='directory to write the Parquet datasets to')
+    arg_parser.add_argument('--batch-size', type=int, default=10000, help='rows fetched and written per batch')
+    arg_parser.add_argument('--partition-by', choices=['language', 'year'], default=None,
+                            help='partition book level datasets by language or first publish year')
+    arg_parser.add_argument('--joins', action='store_true', help='also export books joined across the bridge tables')
+    args: argparse.Namespace = arg_parser.parse_args()
+
+    postgres_connection: PostgresConnection = PostgresConnection()
+    engine: Engine = postgres_connection.get_engine()
+
+    parquet_exporter: ParquetExporter = ParquetExporter(engine, args.output_dir, args.batch_size, args.partition_by)
+    written: Dict[str, int] = parquet_exporter.export_all(include_joins=args.joins)
+
+    for name, rows in written.items():
+        print(f"{name}: {rows} rows")
@@ -0,0 +1,129 @@
+from collections import Counter
+from typing import Dict, List, Optional
+import argparse
+import asyncio
+import math
+import random
+import time
+import httpx
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """
+    Returns the value at the given fraction of a sorted list using the nearest rank.
+
+    Args:
+        sorted_values (List[float]): The values in ascending order.
+        fraction (float): The percentile as a fraction between 0 and 1.
+
+    Returns:
+        float: The percentile value.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+async def fetch_book_ids(client: httpx.AsyncClient, count: int) -> List[str]:
+    """
+    Collects bookIds to request from the list endpoint.
+
+    Args:
+        client (httpx.AsyncClient): The client pointed at the API.
+        count (int): The number of bookIds to collect.
+
+    Returns:
+        List[str]: The collected bookIds.
+    """
+    book_ids: List[str] = []
+    while len(book_ids) < count:
+        response = await client.get('/books', params={'limit': 100, 'offset': len(book_ids)})
+        response.raise_for_status()
+        page = response.json()
+        if not page:
+            break
+        book_ids.extend(book['bookId'] for book in page)
+    return book_ids[:count]
+
+
+async def worker(client: httpx.AsyncClient, book_ids: List[str], hot_fraction: float,
+                 deadline: float, latencies: List[float], errors: List[str]) -> None:
+    """
+    Requests book details until the deadline, favouring the first tenth of the books.
+
+    Args:
+        client (httpx.AsyncClient): The client pointed at the API.
+        book_ids (List[str]): The bookIds to request.
+        hot_fraction (float): The share of requests that go to the hot books.
+        deadline (float): The time.perf_counter() value at which to stop.
+        latencies (List[float]): Receives the latency of each successful request in seconds.
+        errors (List[str]): Receives the status code or transport error name of each failed request.
+    """
+    hot_books = book_ids[:max(1, len(book_ids) // 10)]
+    while time.perf_counter() < deadline:
+        pool = hot_books if random.random() < hot_fraction else book_ids
+        start = time.perf_counter()
+        try:
+            response = await client.get(f'/books/{random.choice(pool)}')
+        except httpx.HTTPError as e:
+            errors.append(type(e).__name__)
+            continue
+        elapsed = time.perf_counter() - start
+        if response.status_code == 200:
+            latencies.append(elapsed)
+        else:
+            errors.append(str(response.status_code))
+
+
+async def run_load_test(base_url: str, concurrency: int, duration: float, books: int, hot_fraction: float) -> None:
+    """
+    Runs the load test and prints throughput and latency percentiles.
+
+    Args:
+        base_url (str): The URL of the running API.
+        concurrency (int): The number of concurrent workers.
+        duration (float): How long to run in seconds.
+        books (int): The number of distinct books to request.
+        hot_fraction (float): The share of requests that go to the hot books.
+    """
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        book_ids = await fetch_book_ids(client, books)
+        if not book_ids:
+            raise SystemExit('No books returned by the API, is the database loaded?')
+
+        latencies: List[float] = []
+        errors: List[str] = []
+        start = time.perf_counter()
+        deadline = start + duration
+        await asyncio.gather(*(worker(client, book_ids, hot_fraction, deadline, latencies, errors)
+                               for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+        try:
+            stats: Optional[Dict[str, int]] = (await client.get('/stats')).json()
+        except httpx.HTTPError:
+            stats = None
+
+    latencies.sort()
+    print(f"requests:   {len(latencies)} ok, {len(errors)} failed in {elapsed:.1f}s")
+    print(f"throughput: {len(latencies) / elapsed:.1f} req/s")
+    print(f"p50:        {percentile(latencies, 0.50) * 1000:.2f} ms")
+    print(f"p99:        {percentile(latencies, 0.99) * 1000:.2f} ms")
+    if errors:
+        print(f"failures:   {', '.join(f'{error} x{count}' for error, count in Counter(errors).most_common())}")
+    if stats is not None:
+        print(f"cache:      {stats['cacheHits']} hits, {stats['cacheMisses']} misses")
+
+
+if __name__ == "__main__":
+    arg_parser: argparse.ArgumentParser = argparse.ArgumentParser(description='Load test the GoodReads read API.')
+    arg_parser.add_argument('--url', default='http://127.0.0.1:8000', help='URL of the running API')
+    arg_parser.add_argument('--concurrency', type=int, default=50, help='concurrent workers')
+    arg_parser.add_argument('--duration', type=float, default=30, help='seconds to run')
+    arg_parser.add_argument('--books', type=int, default=1000, help='distinct books to request')
+    arg_parser.add_argument('--hot-fraction', type=float, default=0.8, help='share of requests for the hot books')
+    args: argparse.Namespace = arg_parser.parse_args()
+
+    asyncio.run(run_load_test(args.url, args.concurrency, args.duration, args.books, args.hot_fraction))
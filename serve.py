@@ -0,0 +1,20 @@
+from src.database.PostgresConnection import PostgresConnection
+from src.api.App import create_app
+from sqlalchemy.ext.asyncio import AsyncEngine
+from fastapi import FastAPI
+import argparse
+import uvicorn
+
+if __name__ == "__main__":
+    arg_parser: argparse.ArgumentParser = argparse.ArgumentParser(description='Serve the GoodReads read API.')
+    arg_parser.add_argument('--host', default='127.0.0.1', help='interface to listen on')
+    arg_parser.add_argument('--port', type=int, default=8000, help='port to listen on')
+    arg_parser.add_argument('--pool-size', type=int, default=10, help='database connections kept open')
+    arg_parser.add_argument('--cache-size', type=int, default=1024, help='book details kept in the LRU cache')
+    args: argparse.Namespace = arg_parser.parse_args()
+
+    postgres_connection: PostgresConnection = PostgresConnection()
+    engine: AsyncEngine = postgres_connection.get_async_engine(pool_size=args.pool_size)
+
+    app: FastAPI = create_app(engine, cache_size=args.cache_size)
+    uvicorn.run(app, host=args.host, port=args.port)
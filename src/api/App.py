@@ -0,0 +1,78 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional
+from fastapi import FastAPI, HTTPException, Query, Request
+from sqlalchemy.ext.asyncio import AsyncEngine
+from src.api.BookRepository import BookRepository
+from src.api.Cache import LRUCache, RequestCoalescer
+from src.api.Schemas import BookDetailSchema, BookSummarySchema, GenreCountSchema
+
+
+def create_app(engine: AsyncEngine, cache_size: int = 1024) -> FastAPI:
+    """
+    Creates the read API over the books schema.
+
+    Book details are kept in an in-process LRU cache. Identical requests that arrive while
+    one is already being served share its database query instead of issuing their own.
+
+    Args:
+        engine (AsyncEngine): The SQLAlchemy async engine connected to the database.
+        cache_size (int): The maximum number of book details kept in the cache.
+
+    Returns:
+        FastAPI: The application.
+    """
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        app.state.repository = BookRepository(engine)
+        app.state.book_cache = LRUCache(cache_size)
+        app.state.coalescer = RequestCoalescer()
+        yield
+        await engine.dispose()
+
+    app = FastAPI(title='GoodReads Best Books API', lifespan=lifespan)
+
+    @app.get('/books/{book_id}', response_model=BookDetailSchema)
+    async def get_book(request: Request, book_id: str) -> BookDetailSchema:
+        state = request.app.state
+        book = state.book_cache.get(book_id)
+        if book is None:
+            book = await state.coalescer.run(('book', book_id), lambda: state.repository.get_book(book_id))
+            if book is None:
+                raise HTTPException(status_code=404, detail=f"Book {book_id} not found")
+            state.book_cache.put(book_id, book)
+        return book
+
+    @app.get('/books', response_model=List[BookSummarySchema])
+    async def list_books(request: Request,
+                         language: Optional[str] = None,
+                         genre: Optional[str] = None,
+                         author: Optional[str] = None,
+                         series: Optional[str] = None,
+                         min_rating: Optional[float] = Query(default=None, ge=0, le=5),
+                         limit: int = Query(default=20, ge=1, le=100),
+                         offset: int = Query(default=0, ge=0)) -> List[BookSummarySchema]:
+        state = request.app.state
+        key = ('books', language, genre, author, series, min_rating, limit, offset)
+        return await state.coalescer.run(key, lambda: state.repository.list_books(
+            language, genre, author, series, min_rating, limit, offset))
+
+    @app.get('/genres', response_model=List[GenreCountSchema])
+    async def list_genres(request: Request,
+                          limit: int = Query(default=50, ge=1, le=500),
+                          offset: int = Query(default=0, ge=0)) -> List[GenreCountSchema]:
+        state = request.app.state
+        return await state.coalescer.run(('genres', limit, offset),
+                                         lambda: state.repository.list_genres(limit, offset))
+
+    @app.get('/stats')
+    async def stats(request: Request) -> Dict[str, int]:
+        state = request.app.state
+        return {
+            'cacheSize': len(state.book_cache),
+            'cacheHits': state.book_cache.hits,
+            'cacheMisses': state.book_cache.misses,
+            'inFlight': len(state.coalescer.in_flight),
+        }
+
+    return app
@@ -0,0 +1,137 @@
+from typing import List, Optional
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import load_only, selectinload
+from src.database.Models import AllGoodBooksInfo, Author, Genres, Series, books_genres
+from src.api.Schemas import BookDetailSchema, BookSummarySchema, GenreCountSchema
+
+# The ingestion drops the raw list columns from all_good_books_info after normalizing them,
+# so books are always loaded with an explicit column list rather than the full mapping.
+BOOK_SUMMARY_COLUMNS = (
+    AllGoodBooksInfo.bookId,
+    AllGoodBooksInfo.title,
+    AllGoodBooksInfo.rating,
+    AllGoodBooksInfo.language,
+    AllGoodBooksInfo.numRatings,
+    AllGoodBooksInfo.coverImg,
+)
+
+BOOK_DETAIL_COLUMNS = BOOK_SUMMARY_COLUMNS + (
+    AllGoodBooksInfo.description,
+    AllGoodBooksInfo.isbn,
+    AllGoodBooksInfo.likedPercent,
+    AllGoodBooksInfo.bbeScore,
+    AllGoodBooksInfo.bbeVotes,
+    AllGoodBooksInfo.price,
+    AllGoodBooksInfo.series_id,
+    AllGoodBooksInfo.publish_info_id,
+)
+
+
+class BookRepository:
+    """
+    A class for reading books and their related entities through an async SQLAlchemy engine.
+
+    Related authors, genres, series and publishing information are loaded with selectin
+    loading, so a page of books costs one query per relationship instead of one per book.
+
+    Attributes:
+        session_factory (async_sessionmaker[AsyncSession]): Creates sessions bound to the engine.
+    """
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        """
+        Initializes the BookRepository with an async database engine.
+
+        Args:
+            engine (AsyncEngine): The SQLAlchemy async engine connected to the database.
+        """
+        self.session_factory: async_sessionmaker[AsyncSession] = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def get_book(self, book_id: str) -> Optional[BookDetailSchema]:
+        """
+        Gets a book by its bookId with authors, genres, series and publishing information.
+
+        Args:
+            book_id (str): The GoodReads bookId.
+
+        Returns:
+            Optional[BookDetailSchema]: The book, or None if it does not exist.
+        """
+        query = (
+            select(AllGoodBooksInfo)
+            .options(
+                load_only(*BOOK_DETAIL_COLUMNS),
+                selectinload(AllGoodBooksInfo.authors),
+                selectinload(AllGoodBooksInfo.genres_list),
+                selectinload(AllGoodBooksInfo.booksSeries),
+                selectinload(AllGoodBooksInfo.publishSeries),
+            )
+            .where(AllGoodBooksInfo.bookId == book_id)
+        )
+        async with self.session_factory() as session:
+            book = (await session.execute(query)).scalars().first()
+            return BookDetailSchema.model_validate(book) if book is not None else None
+
+    async def list_books(self, language: Optional[str] = None, genre: Optional[str] = None,
+                         author: Optional[str] = None, series: Optional[str] = None,
+                         min_rating: Optional[float] = None, limit: int = 20,
+                         offset: int = 0) -> List[BookSummarySchema]:
+        """
+        Lists books matching all of the given filters, ordered by bbeScore descending.
+
+        Args:
+            language (Optional[str]): Only books in this language.
+            genre (Optional[str]): Only books with this genre.
+            author (Optional[str]): Only books by this author.
+            series (Optional[str]): Only books in this series.
+            min_rating (Optional[float]): Only books rated at least this.
+            limit (int): The maximum number of books to return.
+            offset (int): The number of books to skip.
+
+        Returns:
+            List[BookSummarySchema]: The matching books with their authors.
+        """
+        query = select(AllGoodBooksInfo).options(
+            load_only(*BOOK_SUMMARY_COLUMNS),
+            selectinload(AllGoodBooksInfo.authors),
+        )
+        if language is not None:
+            query = query.where(AllGoodBooksInfo.language == language)
+        if genre is not None:
+            query = query.where(AllGoodBooksInfo.genres_list.any(Genres.genres == genre))
+        if author is not None:
+            query = query.where(AllGoodBooksInfo.authors.any(Author.author == author))
+        if series is not None:
+            query = query.where(AllGoodBooksInfo.booksSeries.has(Series.series == series))
+        if min_rating is not None:
+            query = query.where(AllGoodBooksInfo.rating >= min_rating)
+        query = query.order_by(AllGoodBooksInfo.bbeScore.desc(), AllGoodBooksInfo.index).limit(limit).offset(offset)
+
+        async with self.session_factory() as session:
+            books = (await session.execute(query)).scalars().all()
+            return [BookSummarySchema.model_validate(book) for book in books]
+
+    async def list_genres(self, limit: int = 50, offset: int = 0) -> List[GenreCountSchema]:
+        """
+        Lists genres ordered by the number of books in them.
+
+        Args:
+            limit (int): The maximum number of genres to return.
+            offset (int): The number of genres to skip.
+
+        Returns:
+            List[GenreCountSchema]: The genres with their book counts.
+        """
+        book_count = func.count(books_genres.c.books_id)
+        query = (
+            select(Genres.index, Genres.genres, book_count.label('bookCount'))
+            .join(books_genres, books_genres.c.genres_id == Genres.index)
+            .group_by(Genres.index, Genres.genres)
+            .order_by(book_count.desc(), Genres.index)
+            .limit(limit)
+            .offset(offset)
+        )
+        async with self.session_factory() as session:
+            rows = (await session.execute(query)).mappings().all()
+            return [GenreCountSchema(**row) for row in rows]
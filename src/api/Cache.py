@@ -0,0 +1,112 @@
+import asyncio
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class LRUCache:
+    """
+    A bounded in-process cache that evicts the least recently used entry when full.
+
+    Attributes:
+        max_size (int): The maximum number of entries kept in the cache.
+        hits (int): The number of lookups that found an entry.
+        misses (int): The number of lookups that did not find an entry.
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        """
+        Initializes the LRUCache with a maximum size.
+
+        Args:
+            max_size (int): The maximum number of entries kept in the cache.
+        """
+        if max_size <= 0:
+            raise ValueError(f"max_size must be positive, got {max_size}")
+        self.max_size = max_size
+        self.entries: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Returns the cached value for a key and marks it as recently used.
+
+        Args:
+            key (Hashable): The cache key.
+
+        Returns:
+            Optional[Any]: The cached value, or None if the key is not cached.
+        """
+        try:
+            value = self.entries[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Stores a value, evicting the least recently used entry if the cache is full.
+
+        Args:
+            key (Hashable): The cache key.
+            value (Any): The value to cache.
+        """
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+class RequestCoalescer:
+    """
+    Runs at most one coroutine per key at a time and shares its result with every caller
+    that asks for the same key while it is in flight.
+
+    Attributes:
+        in_flight (Dict[Hashable, asyncio.Future]): The running tasks by key.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the RequestCoalescer with no requests in flight.
+        """
+        self.in_flight: Dict[Hashable, asyncio.Future] = {}
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Awaits the in-flight task for a key, starting it with the factory if there is none.
+
+        A caller that is cancelled does not cancel the shared task for the other callers.
+
+        Args:
+            key (Hashable): The key identifying identical requests.
+            factory (Callable[[], Awaitable[Any]]): Creates the coroutine to run.
+
+        Returns:
+            Any: The result of the shared task.
+        """
+        future = self.in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            self.in_flight[key] = future
+            future.add_done_callback(lambda done: self.finish(key, done))
+        return await asyncio.shield(future)
+
+    def finish(self, key: Hashable, future: asyncio.Future) -> None:
+        """
+        Removes a completed task so the next request for its key starts a new one.
+
+        Args:
+            key (Hashable): The key of the completed task.
+            future (asyncio.Future): The completed task.
+        """
+        if self.in_flight.get(key) is future:
+            del self.in_flight[key]
+        if not future.cancelled():
+            future.exception()
@@ -0,0 +1,86 @@
+from datetime import date
+from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class AuthorSchema(BaseModel):
+    """
+    Represents an author in an API response.
+    """
+    model_config = ConfigDict(from_attributes=True)
+
+    index: int
+    author: str
+
+
+class GenreSchema(BaseModel):
+    """
+    Represents a genre in an API response.
+    """
+    model_config = ConfigDict(from_attributes=True)
+
+    index: int
+    genres: str
+
+
+class SeriesSchema(BaseModel):
+    """
+    Represents a series of books in an API response.
+    """
+    model_config = ConfigDict(from_attributes=True)
+
+    index: int
+    series: Optional[str] = None
+
+
+class PublishInfoSchema(BaseModel):
+    """
+    Represents publishing information in an API response.
+    """
+    model_config = ConfigDict(from_attributes=True)
+
+    bookFormat: Optional[str] = None
+    edition: Optional[str] = None
+    pages: Optional[int] = None
+    publisher: Optional[str] = None
+    publishDate: Optional[date] = None
+    firstPublishDate: Optional[date] = None
+
+
+class GenreCountSchema(BaseModel):
+    """
+    Represents a genre together with the number of books in it.
+    """
+    index: int
+    genres: str
+    bookCount: int
+
+
+class BookSummarySchema(BaseModel):
+    """
+    Represents a book in a list response.
+    """
+    model_config = ConfigDict(from_attributes=True)
+
+    bookId: str
+    title: str
+    rating: float
+    language: Optional[str] = None
+    numRatings: int
+    coverImg: Optional[str] = None
+    authors: List[AuthorSchema]
+
+
+class BookDetailSchema(BookSummarySchema):
+    """
+    Represents a book with its genres, series and publishing information in a detail response.
+    """
+    description: Optional[str] = None
+    isbn: str
+    likedPercent: Optional[float] = None
+    bbeScore: float
+    bbeVotes: int
+    price: Optional[float] = None
+    genres: List[GenreSchema] = Field(validation_alias='genres_list')
+    series: Optional[SeriesSchema] = Field(default=None, validation_alias='booksSeries')
+    publishInfo: Optional[PublishInfoSchema] = Field(default=None, validation_alias='publishSeries')
@@ -0,0 +1,300 @@
+import os
+import shutil
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from sqlalchemy import Integer, MetaData, Table, cast, extract, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.sql import Select, sqltypes
+from sqlalchemy.sql.elements import Label
+from sqlalchemy.types import TypeEngine
+from typing import Dict, Iterator, List, Optional, Tuple
+
+PARTITION_COLUMNS: Dict[str, str] = {
+    'language': 'language',
+    'year': 'firstPublishYear',
+}
+
+DIMENSION_TABLES: List[str] = [
+    'series', 'publish_info', 'author', 'genres', 'characters', 'awards', 'ratingsbystars', 'setting'
+]
+
+BRIDGE_TABLES: Dict[str, Tuple[str, str, str]] = {
+    'books_authors': ('author_id', 'author', 'author'),
+    'books_genres': ('genres_id', 'genres', 'genres'),
+    'books_characters': ('characters_id', 'characters', 'characters'),
+    'books_awards': ('awards_id', 'awards', 'awards'),
+    'books_settings': ('settings_id', 'setting', 'setting'),
+    'books_stars': ('stars_id', 'ratingsbystars', 'ratingsByStars'),
+}
+
+
+def arrow_type(sql_type: TypeEngine) -> pa.DataType:
+    """
+    Maps a SQLAlchemy column type to the Arrow type it is written as.
+
+    Args:
+        sql_type (TypeEngine): The SQLAlchemy column type.
+
+    Returns:
+        pa.DataType: The matching Arrow type, strings for anything unrecognised.
+    """
+    if isinstance(sql_type, sqltypes.Boolean):
+        return pa.bool_()
+    if isinstance(sql_type, sqltypes.Integer):
+        return pa.int64()
+    if isinstance(sql_type, sqltypes.Float):
+        return pa.float64()
+    if isinstance(sql_type, sqltypes.Numeric):
+        if sql_type.precision is not None:
+            return pa.decimal128(sql_type.precision, sql_type.scale or 0)
+        return pa.float64()
+    if isinstance(sql_type, sqltypes.DateTime):
+        return pa.timestamp('us', tz='UTC' if sql_type.timezone else None)
+    if isinstance(sql_type, sqltypes.Date):
+        return pa.date32()
+    return pa.string()
+
+
+def arrow_schema(query: Select) -> pa.Schema:
+    """
+    Builds the Arrow schema of a query from the types of its selected columns.
+
+    Args:
+        query (Select): The query to describe.
+
+    Returns:
+        pa.Schema: The schema every batch of the query is written with.
+    """
+    return pa.schema([pa.field(column.name, arrow_type(column.type)) for column in query.selected_columns])
+
+
+def to_record_batch(df: pd.DataFrame, schema: pa.Schema) -> pa.RecordBatch:
+    """
+    Converts a batch of rows to an Arrow record batch with the given schema.
+
+    Args:
+        df (pd.DataFrame): The batch of rows.
+        schema (pa.Schema): The schema of the dataset the batch belongs to.
+
+    Returns:
+        pa.RecordBatch: The converted batch.
+    """
+    return pa.RecordBatch.from_pandas(df, schema=schema, preserve_index=False)
+
+
+class ParquetExporter:
+    """
+    A class for streaming database tables into Parquet files in fixed-size batches.
+
+    Rows are fetched through a server-side cursor, so at most one batch is held in memory
+    at a time. Each dataset is written by a single writer, so every partition gets one file
+    with a row group per batch. Book level exports can be partitioned by language or first
+    publish year.
+
+    Attributes:
+        engine (Engine): The SQLAlchemy engine connected to the database.
+        output_dir (str): The directory the Parquet datasets are written to.
+        batch_size (int): The number of rows fetched and written per batch.
+        partition_by (Optional[str]): Either 'language', 'year' or None.
+    """
+
+    def __init__(self, engine: Engine, output_dir: str, batch_size: int = 10000,
+                 partition_by: Optional[str] = None) -> None:
+        """
+        Initializes the ParquetExporter with a database engine and export settings.
+
+        Args:
+            engine (Engine): The SQLAlchemy engine connected to the database.
+            output_dir (str): The directory the Parquet datasets are written to.
+            batch_size (int): The number of rows fetched and written per batch.
+            partition_by (Optional[str]): Either 'language', 'year' or None.
+        """
+        if partition_by is not None and partition_by not in PARTITION_COLUMNS:
+            raise ValueError(f"partition_by must be one of {list(PARTITION_COLUMNS)}, got {partition_by!r}")
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        self.engine = engine
+        self.output_dir = output_dir
+        self.batch_size = batch_size
+        self.partition_by = partition_by
+        self.metadata = MetaData()
+
+    def table(self, table_name: str) -> Table:
+        """
+        Returns a table reflected from the database, so queries carry the stored column types.
+
+        Args:
+            table_name (str): The name of the table.
+
+        Returns:
+            Table: The reflected table.
+        """
+        if table_name not in self.metadata.tables:
+            Table(table_name, self.metadata, autoload_with=self.engine)
+        return self.metadata.tables[table_name]
+
+    def first_publish_year(self, publish_info: Table) -> Label:
+        """
+        Builds the first publish year column taken from publish_info.
+
+        Args:
+            publish_info (Table): The reflected publish_info table.
+
+        Returns:
+            Label: The firstPublishYear column expression.
+        """
+        return cast(extract('year', publish_info.c.firstPublishDate), Integer).label('firstPublishYear')
+
+    def books_query(self) -> Select:
+        """
+        Builds the query for the books table with the first publish year attached.
+
+        Returns:
+            Select: The query.
+        """
+        books = self.table('all_good_books_info')
+        publish_info = self.table('publish_info')
+        return (
+            select(books, self.first_publish_year(publish_info))
+            .select_from(books.outerjoin(publish_info, publish_info.c.index == books.c.publish_info_id))
+        )
+
+    def bridge_query(self, bridge_table: str) -> Select:
+        """
+        Builds a denormalized query joining books to a dimension table through a bridge table.
+
+        Args:
+            bridge_table (str): The name of the bridge table, e.g. 'books_authors'.
+
+        Returns:
+            Select: The query returning one row per book and dimension value.
+        """
+        fk_column, dimension_table, value_column = BRIDGE_TABLES[bridge_table]
+        bridge = self.table(bridge_table)
+        books = self.table('all_good_books_info')
+        dimension = self.table(dimension_table)
+        publish_info = self.table('publish_info')
+        return (
+            select(
+                books.c.index.label('books_id'),
+                books.c.bookId,
+                books.c.title,
+                books.c.language,
+                self.first_publish_year(publish_info),
+                dimension.c.index.label(fk_column),
+                dimension.c[value_column],
+            )
+            .select_from(
+                bridge
+                .join(books, books.c.index == bridge.c.books_id)
+                .join(dimension, dimension.c.index == bridge.c[fk_column])
+                .outerjoin(publish_info, publish_info.c.index == books.c.publish_info_id)
+            )
+        )
+
+    def stream_batches(self, query: Select) -> Iterator[pd.DataFrame]:
+        """
+        Streams the result of a query as DataFrames of at most batch_size rows.
+
+        Args:
+            query (Select): The query to run.
+
+        Yields:
+            pd.DataFrame: The next batch of rows.
+        """
+        with self.engine.connect() as con:
+            con = con.execution_options(stream_results=True, max_row_buffer=self.batch_size)
+            for chunk in pd.read_sql(query, con, chunksize=self.batch_size,
+                                     dtype_backend='numpy_nullable'):
+                yield chunk
+
+    def write_query(self, query: Select, name: str, partition_column: Optional[str] = None) -> int:
+        """
+        Streams a query into a Parquet dataset, replacing any previous export with the same name.
+
+        Args:
+            query (Select): The query to run.
+            name (str): The dataset name, used as the directory name under output_dir.
+            partition_column (Optional[str]): The column to partition the dataset by.
+
+        Returns:
+            int: The number of rows written.
+        """
+        dataset_path = os.path.join(self.output_dir, name)
+        if os.path.exists(dataset_path):
+            shutil.rmtree(dataset_path)
+        os.makedirs(dataset_path)
+
+        schema = arrow_schema(query)
+        rows = 0
+
+        def record_batches() -> Iterator[pa.RecordBatch]:
+            nonlocal rows
+            for df in self.stream_batches(query):
+                batch = to_record_batch(df, schema)
+                rows += batch.num_rows
+                yield batch
+
+        if partition_column:
+            ds.write_dataset(record_batches(), dataset_path, schema=schema, format='parquet',
+                             partitioning=[partition_column], partitioning_flavor='hive',
+                             basename_template='part-{i}.parquet', max_rows_per_group=self.batch_size)
+        else:
+            with pq.ParquetWriter(os.path.join(dataset_path, 'part-0.parquet'), schema) as writer:
+                for batch in record_batches():
+                    writer.write_batch(batch)
+        return rows
+
+    def export_books(self) -> int:
+        """
+        Exports the books table, partitioned if partition_by is set.
+
+        Returns:
+            int: The number of rows written.
+        """
+        partition_column = PARTITION_COLUMNS.get(self.partition_by) if self.partition_by else None
+        return self.write_query(self.books_query(), 'all_good_books_info', partition_column)
+
+    def export_dimension_tables(self) -> Dict[str, int]:
+        """
+        Exports the lookup tables and bridge tables as they are stored in the database.
+
+        Returns:
+            Dict[str, int]: The number of rows written per table.
+        """
+        written = {}
+        for table_name in DIMENSION_TABLES + list(BRIDGE_TABLES):
+            written[table_name] = self.write_query(select(self.table(table_name)), table_name)
+        return written
+
+    def export_joins(self) -> Dict[str, int]:
+        """
+        Exports books denormalized across every bridge table, partitioned if partition_by is set.
+
+        Returns:
+            Dict[str, int]: The number of rows written per joined dataset.
+        """
+        partition_column = PARTITION_COLUMNS.get(self.partition_by) if self.partition_by else None
+        written = {}
+        for bridge_table in BRIDGE_TABLES:
+            name = f'{bridge_table}_joined'
+            written[name] = self.write_query(self.bridge_query(bridge_table), name, partition_column)
+        return written
+
+    def export_all(self, include_joins: bool = False) -> Dict[str, int]:
+        """
+        Exports the books table, the lookup and bridge tables and optionally the denormalized joins.
+
+        Args:
+            include_joins (bool): Whether to also export books joined across the bridge tables.
+
+        Returns:
+            Dict[str, int]: The number of rows written per dataset.
+        """
+        written = {'all_good_books_info': self.export_books()}
+        written.update(self.export_dimension_tables())
+        if include_joins:
+            written.update(self.export_joins())
+        return written
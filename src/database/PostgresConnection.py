@@ -2,6 +2,7 @@ from dotenv import load_dotenv
 import os
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlalchemy.pool import StaticPool
 from typing import Optional
 
@@ -14,6 +15,7 @@ class PostgresConnection:
     Attributes:
         url (str): The database URL constructed from environment variables.
         engine (Optional[Engine]): The SQLAlchemy engine connected to the database.
+        async_engine (Optional[AsyncEngine]): The SQLAlchemy async engine connected to the database.
     """
 
     def __init__(self) -> None:
@@ -24,6 +26,7 @@ class PostgresConnection:
         """
         self.url: str = f"postgresql://{os.getenv('DB_USER')}:{os.getenv('DB_PASSWORD')}@{os.getenv('DB_HOST')}/{os.getenv('DB_DATABASE')}"
         self.engine: Optional[Engine] = None
+        self.async_engine: Optional[AsyncEngine] = None
 
     def get_engine(self) -> Engine:
         """
@@ -35,3 +38,16 @@ class PostgresConnection:
         self.engine = create_engine(self.url, poolclass=StaticPool)
         return self.engine
 
+    def get_async_engine(self, pool_size: int = 10) -> AsyncEngine:
+        """
+        Creates and returns a SQLAlchemy async engine for the PostgreSQL database using asyncpg.
+
+        Args:
+            pool_size (int): The number of connections kept open in the pool.
+
+        Returns:
+            AsyncEngine: The SQLAlchemy async engine connected to the PostgreSQL database.
+        """
+        async_url = self.url.replace('postgresql://', 'postgresql+asyncpg://', 1)
+        self.async_engine = create_async_engine(async_url, pool_size=pool_size, pool_pre_ping=True)
+        return self.async_engine
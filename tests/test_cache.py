@@ -0,0 +1,79 @@
+import asyncio
+import pytest
+from src.api.Cache import LRUCache, RequestCoalescer
+
+
+def test_coalescer_runs_factory_once_for_concurrent_callers():
+    calls = 0
+
+    async def factory():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return 'book'
+
+    async def main():
+        coalescer = RequestCoalescer()
+        results = await asyncio.gather(*(coalescer.run('key', factory) for _ in range(10)))
+        return coalescer, results
+
+    coalescer, results = asyncio.run(main())
+    assert calls == 1
+    assert results == ['book'] * 10
+    assert coalescer.in_flight == {}
+
+
+def test_coalescer_raises_for_every_waiter_and_clears_key():
+    async def factory():
+        await asyncio.sleep(0.01)
+        raise ValueError('boom')
+
+    async def main():
+        coalescer = RequestCoalescer()
+        results = await asyncio.gather(*(coalescer.run('key', factory) for _ in range(3)),
+                                       return_exceptions=True)
+        return coalescer, results
+
+    coalescer, results = asyncio.run(main())
+    assert all(isinstance(result, ValueError) for result in results)
+    assert coalescer.in_flight == {}
+
+
+def test_cancelling_one_waiter_does_not_cancel_shared_task():
+    async def main():
+        coalescer = RequestCoalescer()
+        release = asyncio.Event()
+
+        async def factory():
+            await release.wait()
+            return 'book'
+
+        cancelled = asyncio.ensure_future(coalescer.run('key', factory))
+        survivor = asyncio.ensure_future(coalescer.run('key', factory))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        return await survivor
+
+    assert asyncio.run(main()) == 'book'
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(max_size=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+    cache.put('c', 3)
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert len(cache) == 2
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_lru_cache_rejects_non_positive_size():
+    with pytest.raises(ValueError):
+        LRUCache(max_size=0)
@@ -0,0 +1,67 @@
+import pytest
+
+pd = pytest.importorskip('pandas')
+pa = pytest.importorskip('pyarrow')
+sqlalchemy = pytest.importorskip('sqlalchemy')
+
+from datetime import date
+from sqlalchemy import Column, Date, DateTime, Float, Integer, MetaData, String, Table, select
+from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION
+from src.database.ParquetExporter import arrow_schema, arrow_type, to_record_batch
+
+
+@pytest.mark.parametrize('sql_type, expected', [
+    (Integer(), pa.int64()),
+    (Float(), pa.float64()),
+    (DOUBLE_PRECISION(), pa.float64()),
+    (Date(), pa.date32()),
+    (DateTime(timezone=True), pa.timestamp('us', tz='UTC')),
+    (String(), pa.string()),
+])
+def test_arrow_type(sql_type, expected):
+    assert arrow_type(sql_type) == expected
+
+
+@pytest.fixture
+def books_query():
+    books = Table(
+        'books', MetaData(),
+        Column('index', Integer, primary_key=True),
+        Column('title', String),
+        Column('price', Float),
+        Column('publishDate', Date),
+    )
+    return select(books.c.index, books.c.title, books.c.price, books.c.publishDate)
+
+
+def test_arrow_schema_uses_selected_column_types(books_query):
+    schema = arrow_schema(books_query)
+    assert schema.names == ['index', 'title', 'price', 'publishDate']
+    assert schema.types == [pa.int64(), pa.string(), pa.float64(), pa.date32()]
+
+
+def test_all_null_batch_keeps_schema(books_query):
+    schema = arrow_schema(books_query)
+    df = pd.DataFrame({
+        'index': pd.array([None, None], dtype='Int64'),
+        'title': ['a', 'b'],
+        'price': pd.array([None, None], dtype='Float64'),
+        'publishDate': [None, None],
+    })
+    batch = to_record_batch(df, schema)
+    assert batch.schema == schema
+    assert batch.column('index').null_count == 2
+    assert batch.column('publishDate').null_count == 2
+
+
+def test_batch_with_values_matches_all_null_batch_schema(books_query):
+    schema = arrow_schema(books_query)
+    df = pd.DataFrame({
+        'index': pd.array([1, 2], dtype='Int64'),
+        'title': ['a', None],
+        'price': pd.array([9.99, None], dtype='Float64'),
+        'publishDate': [date(2001, 2, 3), None],
+    })
+    batch = to_record_batch(df, schema)
+    assert batch.schema == schema
+    assert batch.column('publishDate').to_pylist() == [date(2001, 2, 3), None]